@@ -11,10 +11,36 @@ import sys
 import random
 import numpy as np
 
+# Bind hot-path math and random functions once to skip the module attribute lookup per call
+_sqrt = math.sqrt
+_hypot = math.hypot
+_cos = math.cos
+_sin = math.sin
+_atan2 = math.atan2
+_pi = math.pi
+_rand = random.random
+_rng = np.random.default_rng()
+
 # Initialize Pygame
 pygame.init()
 pygame.mixer.init()  # Initialize sound mixer
 
+# Keys, event types and per-frame pygame calls used in the update, draw and
+# event loops, bound once
+K_LEFT = pygame.K_LEFT
+K_RIGHT = pygame.K_RIGHT
+K_ESCAPE = pygame.K_ESCAPE
+K_R = pygame.K_r
+QUIT = pygame.QUIT
+KEYDOWN = pygame.KEYDOWN
+VIDEOEXPOSE = pygame.VIDEOEXPOSE
+_get_ticks = pygame.time.get_ticks
+_key_get_pressed = pygame.key.get_pressed
+_event_get = pygame.event.get
+_event_wait = pygame.event.wait
+_flip = pygame.display.flip
+_update_rects = pygame.display.update
+
 # Constants
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
@@ -33,27 +59,60 @@ BRIGHT_BLUE = (50, 50, 255)
 
 # Game settings
 CIRCLE_RADIUS = 250
-CIRCLE_CENTER = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+CIRCLE_CX = SCREEN_WIDTH // 2
+CIRCLE_CY = SCREEN_HEIGHT // 2
+CIRCLE_CENTER = (CIRCLE_CX, CIRCLE_CY)
 PADDLE_LENGTH = 60
 PADDLE_THICKNESS = 8
 BALL_RADIUS = 8
 BALL_SPEED = 5
 PADDLE_SPEED = 3
+PADDLE_STEP = PADDLE_SPEED * 0.02  # Paddle movement per frame in radians
+# Paddle geometry: it rides an arc of fixed radius and spans a fixed angle,
+# so the chord between its endpoints has a constant length too
+PADDLE_RADIUS = CIRCLE_RADIUS - PADDLE_THICKNESS // 2
+PADDLE_HALF_LEN_RAD = (PADDLE_LENGTH / 2) / PADDLE_RADIUS
+PADDLE_HALF_COS = math.cos(PADDLE_HALF_LEN_RAD)
+PADDLE_HALF_SIN = math.sin(PADDLE_HALF_LEN_RAD)
+PADDLE_CHORD = 2 * PADDLE_RADIUS * PADDLE_HALF_SIN
+INV_PADDLE_CHORD = 1.0 / PADDLE_CHORD
+INV_PADDLE_CHORD_SQ = INV_PADDLE_CHORD * INV_PADDLE_CHORD
+# Sin/cos table for paddle angles: 2048 steps per turn is well under a pixel
+# at the paddle radius. Stored as lists, whose indexing beats numpy scalars
+_ANG_N = 2048  # Power of two so wrapping is a mask
+_ANG_SCALE = _ANG_N / (2 * math.pi)
+_ANG_SIN = np.sin(np.linspace(0, 2 * math.pi, _ANG_N, endpoint=False)).tolist()
+_ANG_COS = np.cos(np.linspace(0, 2 * math.pi, _ANG_N, endpoint=False)).tolist()
+PADDLE_CONTACT_SQ = (BALL_RADIUS + PADDLE_THICKNESS * 0.5) ** 2  # Ball touches paddle within this
+# Farthest a touching ball can be from the paddle center, and its square
+PADDLE_REACH = PADDLE_LENGTH * 0.5 + BALL_RADIUS + PADDLE_THICKNESS * 0.5
+PADDLE_REACH_SQ = PADDLE_REACH ** 2
+# Center distance at which the ball bounces off the boundary, and the squared
+# distances for bouncing and for counting as having reached the boundary
+# (life lost in the green zone)
+BALL_BOUNCE_RADIUS = CIRCLE_RADIUS - BALL_RADIUS
+BALL_BOUNCE_R2 = BALL_BOUNCE_RADIUS ** 2
+LIFE_LOST_R2 = (CIRCLE_RADIUS - BALL_RADIUS - 5) ** 2
+RNG_POOL_SIZE = 4096  # Bounce jitter values drawn per batch; power of two so wrapping is a mask
 
 
 def generate_beep_sound(frequency, duration, sample_rate=22050):
     """Generate a simple beep sound"""
     frames = int(duration * sample_rate)
-    arr = np.sin(2 * np.pi * frequency * np.linspace(0, duration, frames))
-    arr = (arr * 32767).astype(np.int16)
-    arr = np.repeat(arr.reshape(frames, 1), 2, axis=1)  # Make stereo
+    # Sine in float32 scratch, written straight into the stereo int16 buffer
+    phase = np.arange(frames, dtype=np.float32) * np.float32(2 * np.pi * frequency / sample_rate)
+    scratch = np.sin(phase, out=phase)
+    scratch *= 32767.0
+    arr = np.empty((frames, 2), dtype=np.int16)
+    arr[:, 0] = scratch
+    arr[:, 1] = arr[:, 0]  # Make stereo
     sound = pygame.sndarray.make_sound(arr)
     return sound
 
 def generate_noise_sound(duration, sample_rate=22050):
     """Generate a noise sound for game over"""
     frames = int(duration * sample_rate)
-    arr = np.random.randint(-2000, 2000, (frames, 2), dtype=np.int16)
+    arr = _rng.integers(-2000, 2000, size=(frames, 2), dtype=np.int16)
     sound = pygame.sndarray.make_sound(arr)
     return sound
 
@@ -61,49 +120,93 @@ def generate_noise_sound(duration, sample_rate=22050):
 class Ball:
     """Ball class that handles ball physics and rendering"""
     
+    # Pre-rendered ball shared by every instance; built on first use since
+    # converting a surface needs the display to exist
+    _sprite = None
+    _sprite_offset = BALL_RADIUS + 3
+    
     def __init__(self, x, y, game=None):
-        self.x = x
-        self.y = y
-        # Always start moving towards red semicircle (180°-360°)
-        self.dx = random.choice([-1, 1]) * BALL_SPEED * random.uniform(0.7, 1.0)
-        self.dy = -abs(random.uniform(0.7, 1.0)) * BALL_SPEED  # Always negative (upward)
         self.radius = BALL_RADIUS
         self.game = game  # Reference to game for sound effects
+        self.reset(x, y)
+        
+        if Ball._sprite is None:
+            Ball._sprite = Ball._build_sprite()
+    
+    def reset(self, x, y, dx=None, dy=None):
+        """Put the ball at (x, y) and serve it along (dx, dy), or along a
+        random upward direction when none is given"""
+        self.x = x
+        self.y = y
+        self._ix = int(x)
+        self._iy = int(y)
+        self.paddle_cooldown = 0  # Frames left before this ball can hit the paddle again
+        if dx is None:
+            # Always start moving towards red semicircle (180°-360°)
+            sign = 1.0 if _rand() < 0.5 else -1.0
+            dx = sign * (0.7 + 0.3 * _rand())
+            dy = -(0.7 + 0.3 * _rand())  # Always negative (upward)
+        self.set_velocity(dx, dy)
+    
+    @staticmethod
+    def _build_sprite():
+        """Render the ball and its glow ring so draw() is a single blit"""
+        r = BALL_RADIUS
+        size = Ball._sprite_offset * 2
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        center = (Ball._sprite_offset, Ball._sprite_offset)
+        pygame.draw.circle(sprite, WHITE, center, r)
+        # Add a small glow effect
+        pygame.draw.circle(sprite, BRIGHT_GREEN, center, r + 2, 1)
+        return sprite.convert_alpha()
         
     def update(self):
         """Update ball position and handle circular boundary collision"""
-        # Move ball
-        self.x += self.dx
-        self.y += self.dy
-        
-        # Check collision with circular boundary
-        center_x, center_y = CIRCLE_CENTER
-        distance_from_center = math.sqrt((self.x - center_x)**2 + (self.y - center_y)**2)
-        
-        if distance_from_center + self.radius >= CIRCLE_RADIUS:
+        # Work on locals and write each field back once; attribute access is slower
+        dx = self.dx
+        dy = self.dy
+        x = self.x + dx
+        y = self.y + dy
+        
+        # Check collision with circular boundary (squared distance early-out)
+        ex = x - CIRCLE_CX
+        ey = y - CIRCLE_CY
+        d2 = ex * ex + ey * ey
+        if d2 >= BALL_BOUNCE_R2:
             # Play wall bounce sound
             if self.game and self.game.sounds_enabled:
                 self.game.wall_sound.play()
             
             # Calculate reflection off circular boundary
-            # Vector from center to ball
-            normal_x = (self.x - center_x) / distance_from_center
-            normal_y = (self.y - center_y) / distance_from_center
+            # Unit vector from center to ball
+            inv = 1.0 / _sqrt(d2)
+            normal_x = ex * inv
+            normal_y = ey * inv
             
             # Reflect velocity vector
-            dot_product = self.dx * normal_x + self.dy * normal_y
-            self.dx = self.dx - 2 * dot_product * normal_x
-            self.dy = self.dy - 2 * dot_product * normal_y
+            dot_product = dx * normal_x + dy * normal_y
+            self.dx = dx - 2 * dot_product * normal_x
+            self.dy = dy - 2 * dot_product * normal_y
             
             # Move ball back inside circle
-            self.x = center_x + normal_x * (CIRCLE_RADIUS - self.radius)
-            self.y = center_y + normal_y * (CIRCLE_RADIUS - self.radius)
+            x = CIRCLE_CX + normal_x * BALL_BOUNCE_RADIUS
+            y = CIRCLE_CY + normal_y * BALL_BOUNCE_RADIUS
+        
+        self.x = x
+        self.y = y
+        self._ix = int(x)
+        self._iy = int(y)
+    
+    def set_velocity(self, dx, dy):
+        """Point the ball along (dx, dy) at exactly BALL_SPEED.
+        Bounces only reflect and rotate the velocity, so the speed stays put"""
+        scale = BALL_SPEED / _hypot(dx, dy)
+        self.dx = dx * scale
+        self.dy = dy * scale
     
     def draw(self, screen):
-        """Draw the ball"""
-        pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), self.radius)
-        # Add a small glow effect
-        pygame.draw.circle(screen, BRIGHT_GREEN, (int(self.x), int(self.y)), self.radius + 2, 1)
+        """Draw the ball and return the screen area it covers"""
+        return screen.blit(self._sprite, (self._ix - self._sprite_offset, self._iy - self._sprite_offset))
 
 
 class Paddle:
@@ -113,54 +216,59 @@ class Paddle:
         self.angle = math.pi / 2  # Always start at 90 degrees (green)
         self.length = PADDLE_LENGTH
         self.thickness = PADDLE_THICKNESS
+        # Endpoints and center, recomputed only when the angle moves
+        self.start_pos = None
+        self.end_pos = None
+        self.center_pos = None
+        self._recompute()
         
     def update(self, keys):
         """Update paddle position based on input"""
-        if keys[pygame.K_LEFT]:
-            self.angle += PADDLE_SPEED * 0.02  # Convert to radians
-        if keys[pygame.K_RIGHT]:
-            self.angle -= PADDLE_SPEED * 0.02
-            
+        # Key states are bools, so LEFT - RIGHT is -1, 0 or 1
+        delta = (keys[K_LEFT] - keys[K_RIGHT]) * PADDLE_STEP
+        if not delta:
+            return
+        
         # Constrain paddle to green semicircle (0° to 180°) that it protects
-        if self.angle > math.pi:
-            self.angle = math.pi
-        elif self.angle < 0:
-            self.angle = 0
+        angle = self.angle + delta
+        angle = 0.0 if angle < 0.0 else (_pi if angle > _pi else angle)
+        if angle != self.angle:
+            self.angle = angle
+            self._recompute()
+    
+    def _recompute(self):
+        """Recompute paddle endpoints and center from the current angle"""
+        # Angle-sum identities with the constant half-span give both endpoints
+        # and the center from one table lookup
+        idx = int(self.angle * _ANG_SCALE + 0.5) & (_ANG_N - 1)
+        cos_a = _ANG_COS[idx]
+        sin_a = _ANG_SIN[idx]
+        cos_half = PADDLE_HALF_COS
+        sin_half = PADDLE_HALF_SIN
+        
+        self.start_pos = (CIRCLE_CX + PADDLE_RADIUS * (cos_a * cos_half + sin_a * sin_half),
+                          CIRCLE_CY + PADDLE_RADIUS * (sin_a * cos_half - cos_a * sin_half))
+        self.end_pos = (CIRCLE_CX + PADDLE_RADIUS * (cos_a * cos_half - sin_a * sin_half),
+                        CIRCLE_CY + PADDLE_RADIUS * (sin_a * cos_half + cos_a * sin_half))
+        self.center_pos = (CIRCLE_CX + PADDLE_RADIUS * cos_a,
+                           CIRCLE_CY + PADDLE_RADIUS * sin_a)
     
     def get_position(self):
         """Get paddle center position"""
-        center_x, center_y = CIRCLE_CENTER
-        paddle_radius = CIRCLE_RADIUS - self.thickness // 2
-        x = center_x + paddle_radius * math.cos(self.angle)
-        y = center_y + paddle_radius * math.sin(self.angle)
-        return x, y
+        return self.center_pos
     
     def get_endpoints(self):
         """Get paddle start and end points for collision detection"""
-        center_x, center_y = CIRCLE_CENTER
-        paddle_radius = CIRCLE_RADIUS - self.thickness // 2
-        
-        # Calculate half-length in radians
-        half_length_radians = (self.length / 2) / paddle_radius
-        
-        # Start and end angles
-        start_angle = self.angle - half_length_radians
-        end_angle = self.angle + half_length_radians
-        
-        # Calculate positions
-        start_x = center_x + paddle_radius * math.cos(start_angle)
-        start_y = center_y + paddle_radius * math.sin(start_angle)
-        end_x = center_x + paddle_radius * math.cos(end_angle)
-        end_y = center_y + paddle_radius * math.sin(end_angle)
-        
-        return (start_x, start_y), (end_x, end_y)
+        return self.start_pos, self.end_pos
     
     def draw(self, screen):
-        """Draw the paddle"""
-        start_pos, end_pos = self.get_endpoints()
-        pygame.draw.line(screen, GREEN, start_pos, end_pos, self.thickness)
+        """Draw the paddle and return the screen area it covers"""
+        start_pos = self.start_pos
+        end_pos = self.end_pos
+        rect = pygame.draw.line(screen, GREEN, start_pos, end_pos, self.thickness)
         # Add glow effect
-        pygame.draw.line(screen, BRIGHT_GREEN, start_pos, end_pos, self.thickness + 2)
+        glow_rect = pygame.draw.line(screen, BRIGHT_GREEN, start_pos, end_pos, self.thickness + 2)
+        return rect.union(glow_rect)
 
 
 class Game:
@@ -173,6 +281,33 @@ class Game:
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         
+        # Pre-render the static playfield once; draw() just blits it
+        self._background = self._build_background()
+        
+        # The game over dim layer never changes, so build it once as well
+        self._game_over_dim = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._game_over_dim.set_alpha(128)
+        self._game_over_dim.fill(BLACK)
+        
+        # Dirty-rect bookkeeping: screen areas drawn last frame, keyed text
+        # slots with their (surface, rect), and whether the next frame must
+        # repaint the whole screen
+        self._prev_rects = []
+        self._prev_texts = {}
+        self._full_redraw = True
+        
+        # Rendered HUD text per slot as (value, surface)
+        self._hud_cache = {}
+        
+        # Instructions never change, so render them once
+        instructions = [
+            "Use LEFT/RIGHT arrows to move paddle",
+            "Keep the ball from entering the green semicircle!",
+            "Survive as long as possible!"
+        ]
+        self._instruction_texts = [self.small_font.render(instruction, True, WHITE)
+                                   for instruction in instructions]
+        
         # Initialize sounds
         try:
             # Check if pygame mixer is properly initialized
@@ -192,253 +327,355 @@ class Game:
             self.sounds_enabled = False
         
         # Game objects
-        self.ball = Ball(CIRCLE_CENTER[0], CIRCLE_CENTER[1] - 50, self)
+        self.ball = Ball(CIRCLE_CX, CIRCLE_CY - 50, self)
+        self.balls = [self.ball]
         self.paddle = Paddle()
         
+        # Paddle bounce jitter is drawn from a pre-generated batch
+        self._rng_pool = _rng.uniform(-0.5, 0.5, RNG_POOL_SIZE).tolist()
+        self._rng_idx = 0
+        
         # Game state
         self.score = 0
         self.bounces = 0
         self.lives = 3
         self.life_lost = False  # Flag to prevent multiple life losses
-        self.paddle_collision_cooldown = 0  # Prevent multiple paddle hits
+        self._reset_at_tick = None  # When to serve the next ball after a lost life
         self.game_over = False
-        self.start_time = pygame.time.get_ticks()
-        
+        self._game_over_texts = None  # Rendered once when the game ends
+        self.start_time = _get_ticks()
+        
+    def _rand_jitter(self):
+        """Next value in [-0.5, 0.5) from the pool, refilling it once used up"""
+        idx = self._rng_idx
+        value = self._rng_pool[idx]
+        idx = (idx + 1) & (RNG_POOL_SIZE - 1)
+        if idx == 0:
+            self._rng_pool = _rng.uniform(-0.5, 0.5, RNG_POOL_SIZE).tolist()
+        self._rng_idx = idx
+        return value
+    
     def check_paddle_collision(self):
-        """Check if ball collides with paddle - returns True if collision occurred"""
-        # Decrease cooldown timer
-        if self.paddle_collision_cooldown > 0:
-            self.paddle_collision_cooldown -= 1
-            return False  # Skip collision check during cooldown
-        
-        # Get paddle endpoints
-        start_pos, end_pos = self.paddle.get_endpoints()
-        
-        # Check distance from ball to paddle line segment
-        ball_pos = (self.ball.x, self.ball.y)
-        distance = self.point_to_line_distance(ball_pos, start_pos, end_pos)
-        
-        if distance <= self.ball.radius + self.paddle.thickness // 2:
+        """Check every ball against the paddle - returns the balls that hit it"""
+        # Paddle center and endpoints, cached on the paddle
+        paddle_x, paddle_y = self.paddle.center_pos
+        sx, sy = self.paddle.start_pos
+        ex, ey = self.paddle.end_pos
+        seg_dx = ex - sx
+        seg_dy = ey - sy
+        
+        # Scan every ball directly; rebuilding a spatial grid each frame costs
+        # more than the reach test it would save
+        hits = []
+        for ball in self.balls:
+            # Each ball has its own cooldown, so one hit doesn't blind the
+            # paddle to the other balls
+            if ball.paddle_cooldown > 0:
+                ball.paddle_cooldown -= 1
+                continue
+            
+            # Read ball state into locals once; attribute access is slower
+            px = ball.x
+            py = ball.y
+            
+            # Skip the segment test when the ball is far from the paddle center
+            dx = px - paddle_x
+            dy = py - paddle_y
+            if dx * dx + dy * dy > PADDLE_REACH_SQ:
+                continue
+            
+            # Squared distance from ball to paddle line segment; the segment always
+            # has length PADDLE_CHORD, so its squared length is a constant
+            t = ((px - sx) * seg_dx + (py - sy) * seg_dy) * INV_PADDLE_CHORD_SQ
+            t = 0.0 if t < 0.0 else (1.0 if t > 1.0 else t)
+            ddx = px - (sx + t * seg_dx)
+            ddy = py - (sy + t * seg_dy)
+            if ddx * ddx + ddy * ddy > PADDLE_CONTACT_SQ:
+                continue
+            
             # Play paddle hit sound
             if self.sounds_enabled:
                 self.paddle_sound.play()
             
             # Collision detected - reflect ball
-            # Calculate normal vector of paddle
-            paddle_dx = end_pos[0] - start_pos[0]
-            paddle_dy = end_pos[1] - start_pos[1]
-            paddle_length = math.sqrt(paddle_dx**2 + paddle_dy**2)
-            
-            # Normal vector (perpendicular to paddle)
-            normal_x = -paddle_dy / paddle_length
-            normal_y = paddle_dx / paddle_length
+            # Normal vector (perpendicular to paddle), using the constant chord length
+            normal_x = -seg_dy * INV_PADDLE_CHORD
+            normal_y = seg_dx * INV_PADDLE_CHORD
             
             # Reflect ball velocity
-            dot_product = self.ball.dx * normal_x + self.ball.dy * normal_y
-            self.ball.dx = self.ball.dx - 2 * dot_product * normal_x
-            self.ball.dy = self.ball.dy - 2 * dot_product * normal_y
-            
-            # Add some randomness to prevent predictable patterns
-            self.ball.dx += random.uniform(-0.5, 0.5)
-            self.ball.dy += random.uniform(-0.5, 0.5)
+            vx = ball.dx
+            vy = ball.dy
+            dot_product = vx * normal_x + vy * normal_y
+            vx -= 2 * dot_product * normal_x
+            vy -= 2 * dot_product * normal_y
             
-            # Normalize speed
-            speed = math.sqrt(self.ball.dx**2 + self.ball.dy**2)
-            self.ball.dx = (self.ball.dx / speed) * BALL_SPEED
-            self.ball.dy = (self.ball.dy / speed) * BALL_SPEED
+            # Add some randomness to prevent predictable patterns: a small
+            # rotation (±0.1 rad) keeps the speed unchanged, so no renormalizing
+            theta = self._rand_jitter() * 0.2
+            c = _cos(theta)
+            s = _sin(theta)
+            ball.dx = c * vx - s * vy
+            ball.dy = s * vx + c * vy
             
             self.bounces += 1
-            self.paddle_collision_cooldown = 10  # Set cooldown (10 frames)
-            return True  # Collision occurred
-        return False  # No collision
-    
-    def point_to_line_distance(self, point, line_start, line_end):
-        """Calculate distance from point to line segment"""
-        px, py = point
-        x1, y1 = line_start
-        x2, y2 = line_end
-        
-        # Vector from line start to end
-        dx = x2 - x1
-        dy = y2 - y1
-        
-        if dx == 0 and dy == 0:
-            # Line is a point
-            return math.sqrt((px - x1)**2 + (py - y1)**2)
-        
-        # Parameter t for closest point on line
-        t = max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / (dx**2 + dy**2)))
-        
-        # Closest point on line segment
-        closest_x = x1 + t * dx
-        closest_y = y1 + t * dy
-        
-        # Distance from point to closest point
-        return math.sqrt((px - closest_x)**2 + (py - closest_y)**2)
+            ball.paddle_cooldown = 10  # Set cooldown (10 frames)
+            hits.append(ball)
+        return hits
     
     def check_game_over(self):
         """Check if ball crossed the green area without hitting paddle"""
-        center_x, center_y = CIRCLE_CENTER
-        
-        # Calculate distance from center and angle
-        distance_from_center = math.sqrt((self.ball.x - center_x)**2 + (self.ball.y - center_y)**2)
-        ball_angle = math.atan2(self.ball.y - center_y, self.ball.x - center_x)
-        if ball_angle < 0:
-            ball_angle += 2 * math.pi
-        
-        # Check if ball is very close to the circular boundary in the green semicircle
-        if distance_from_center >= CIRCLE_RADIUS - self.ball.radius - 5:  # Close to boundary
-            # Check if ball is trying to enter the green semicircle (0° to 180°) that paddle protects
-            if 0 <= ball_angle <= math.pi and not self.life_lost:
-                print(f"Ball hit green boundary at {math.degrees(ball_angle):.1f}° - losing life!")
-                # Player missed the ball - lose a life
-                self.lives -= 1
-                self.life_lost = True  # Prevent multiple life losses
-                
-                # Play appropriate sound
-                if self.sounds_enabled:
-                    if self.lives <= 0:
-                        self.game_over_sound.play()
-                    else:
-                        self.life_lost_sound.play()
-                
-                if self.lives <= 0:
-                    self.game_over = True
-                else:
-                    # Reset ball position for next life after a short delay
-                    pygame.time.wait(500)  # Brief pause
-                    self.reset_ball()
-                    self.life_lost = False  # Reset flag for next round
+        # Lives follow the served ball only; extra balls in self.balls take
+        # part in paddle collision but never cost a life
+        if self.life_lost:
+            return
+        
+        # The green semicircle (0° to 180°) is exactly the half-plane below the
+        # center line in screen coordinates, which rules out half the frames
+        # before any distance math
+        ey = self.ball.y - CIRCLE_CY
+        if ey < 0:
+            return
+        
+        # Only a ball very close to the circular boundary counts
+        ex = self.ball.x - CIRCLE_CX
+        if ex * ex + ey * ey < LIFE_LOST_R2:
+            return
+        
+        ball_angle = _atan2(ey, ex)
+        print(f"Ball hit green boundary at {math.degrees(ball_angle):.1f}° - losing life!")
+        # Player missed the ball - lose a life
+        self.lives -= 1
+        self.life_lost = True  # Prevent multiple life losses
+        
+        # Play appropriate sound
+        if self.sounds_enabled:
+            if self.lives <= 0:
+                self.game_over_sound.play()
+            else:
+                self.life_lost_sound.play()
+        
+        if self.lives <= 0:
+            self.game_over = True
+        else:
+            # Reset ball position for next life after a short, non-blocking pause
+            self._reset_at_tick = _get_ticks() + 500
     
     def reset_ball(self):
         """Reset ball to center position with velocity directed towards red semicircle"""
-        self.ball = Ball(CIRCLE_CENTER[0], CIRCLE_CENTER[1] - 50, self)
         # Direct ball towards red semicircle (180° to 360°)
         # Set velocity to go upward and slightly to one side
-        self.ball.dx = random.choice([-1, 1]) * BALL_SPEED * random.uniform(0.5, 0.8)
-        self.ball.dy = -abs(random.uniform(0.6, 1.0)) * BALL_SPEED  # Always negative (upward)
+        sign = 1.0 if _rand() < 0.5 else -1.0
+        self.ball.reset(CIRCLE_CX, CIRCLE_CY - 50,
+                        sign * (0.5 + 0.3 * _rand()),
+                        -(0.6 + 0.4 * _rand()))  # Always negative (upward)
     
     def update(self):
         """Update game state"""
         if not self.game_over:
-            keys = pygame.key.get_pressed()
+            # Hold play during the pause after a lost life, then serve a new ball
+            if self._reset_at_tick is not None:
+                if _get_ticks() < self._reset_at_tick:
+                    return
+                self.reset_ball()
+                self.life_lost = False  # Reset flag for next round
+                self._reset_at_tick = None
+            
+            keys = _key_get_pressed()
             
             # Update game objects
             self.paddle.update(keys)
             self.ball.update()
             
             # Check paddle collision first - if ball hits paddle, don't lose life
-            paddle_hit = self.check_paddle_collision()
+            paddle_hits = self.check_paddle_collision()
             
-            # Only check for life loss if paddle was NOT hit
-            if not paddle_hit:
+            # Only check for life loss if the served ball did NOT hit the paddle
+            if self.ball not in paddle_hits:
                 self.check_game_over()
             
             # Update score (time survived)
-            current_time = pygame.time.get_ticks()
+            current_time = _get_ticks()
             self.score = (current_time - self.start_time) // 1000
+            
+            # Build the game over screen once, now that the final numbers are known
+            if self.game_over:
+                self._game_over_texts = self._build_game_over_texts()
+                self._full_redraw = True
     
-    def draw(self):
-        """Draw everything"""
-        self.screen.fill(BLACK)
+    def _build_background(self):
+        """Render the static playfield: boundary circle, center line and zone arcs"""
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        background.fill(BLACK)
         
         # Draw circular boundary
-        pygame.draw.circle(self.screen, DARK_GREEN, CIRCLE_CENTER, CIRCLE_RADIUS, 3)
+        pygame.draw.circle(background, DARK_GREEN, CIRCLE_CENTER, CIRCLE_RADIUS, 3)
         
         # Draw center line to show the boundary
-        pygame.draw.line(self.screen, (100, 100, 0), 
-                        (CIRCLE_CENTER[0] - CIRCLE_RADIUS, CIRCLE_CENTER[1]),
-                        (CIRCLE_CENTER[0] + CIRCLE_RADIUS, CIRCLE_CENTER[1]), 2)
+        pygame.draw.line(background, (100, 100, 0), 
+                        (CIRCLE_CX - CIRCLE_RADIUS, CIRCLE_CY),
+                        (CIRCLE_CX + CIRCLE_RADIUS, CIRCLE_CY), 2)
         
         # Draw red upper semicircle (180° to 360°) - safe zone for ball
-        pygame.draw.arc(self.screen, RED, 
-                       (CIRCLE_CENTER[0] - CIRCLE_RADIUS, CIRCLE_CENTER[1] - CIRCLE_RADIUS,
+        pygame.draw.arc(background, RED, 
+                       (CIRCLE_CX - CIRCLE_RADIUS, CIRCLE_CY - CIRCLE_RADIUS,
                         CIRCLE_RADIUS * 2, CIRCLE_RADIUS * 2),
                        0, math.pi, 4)
         
         # Highlight the bottom semicircle in green (0° to 180°) where paddle moves and protects
-        pygame.draw.arc(self.screen, BRIGHT_GREEN, 
-                       (CIRCLE_CENTER[0] - CIRCLE_RADIUS, CIRCLE_CENTER[1] - CIRCLE_RADIUS,
+        pygame.draw.arc(background, BRIGHT_GREEN, 
+                       (CIRCLE_CX - CIRCLE_RADIUS, CIRCLE_CY - CIRCLE_RADIUS,
                         CIRCLE_RADIUS * 2, CIRCLE_RADIUS * 2),
                        math.pi, 2 * math.pi, 1)
+        return background
+    
+    def _build_game_over_texts(self):
+        """Render the game over text with the final stats as (surface, rect) pairs"""
+        game_over_text = self.font.render("GAME OVER", True, WHITE)
+        final_score_text = self.font.render(f"Final Time: {self.score}s", True, GREEN)
+        final_bounces_text = self.font.render(f"Total Bounces: {self.bounces}", True, GREEN)
+        final_lives_text = self.font.render(f"Lives Used: {3 - self.lives}/3", True, GREEN)
+        restart_text = self.small_font.render("Press R to restart or ESC to quit", True, WHITE)
+        
+        # Center the text
+        game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 80))
+        score_rect = final_score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 40))
+        bounces_rect = final_bounces_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
+        lives_rect = final_lives_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 40))
+        restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 80))
+        
+        return [(game_over_text, game_over_rect),
+                (final_score_text, score_rect),
+                (final_bounces_text, bounces_rect),
+                (final_lives_text, lives_rect),
+                (restart_text, restart_rect)]
+    
+    def _hud(self, slot, value, template):
+        """Return the rendered HUD text for a slot, re-rendering only when its value changes"""
+        cached = self._hud_cache.get(slot)
+        if cached is None or cached[0] != value:
+            cached = (value, self.font.render(template.format(value), True, GREEN))
+            self._hud_cache[slot] = cached
+        return cached[1]
+    
+    def _text_items(self):
+        """Get the (slot, surface, position) of every text item visible this frame"""
+        items = [
+            ('score', self._hud('score', self.score, "Time: {}s"), (10, 10)),
+            ('bounces', self._hud('bounces', self.bounces, "Bounces: {}"), (10, 50)),
+            ('lives', self._hud('lives', self.lives, "Lives: {}"), (10, 90)),
+        ]
         
-        # Draw game objects
-        self.paddle.draw(self.screen)
-        self.ball.draw(self.screen)
+        # Draw instructions
+        if self.score < 3:  # Show instructions for first 3 seconds
+            for i, text in enumerate(self._instruction_texts):
+                items.append((('instruction', i), text, (10, SCREEN_HEIGHT - 80 + i * 25)))
+        return items
+    
+    def draw(self):
+        """Draw everything, sending only the regions that changed to the display"""
+        if self._full_redraw:
+            self._draw_full()
+            return
+        if self.game_over:
+            return  # The game over screen is already on display
         
-        # Draw UI
-        score_text = self.font.render(f"Time: {self.score}s", True, GREEN)
-        bounces_text = self.font.render(f"Bounces: {self.bounces}", True, GREEN)
-        lives_text = self.font.render(f"Lives: {self.lives}", True, GREEN)
+        screen = self.screen
         
-        self.screen.blit(score_text, (10, 10))
-        self.screen.blit(bounces_text, (10, 50))
-        self.screen.blit(lives_text, (10, 90))
+        # Restore the playfield under last frame's objects and text
+        for rect in self._prev_rects:
+            screen.blit(self._background, rect, rect)
+        for _, rect in self._prev_texts.values():
+            screen.blit(self._background, rect, rect)
         
-        # Draw instructions
-        if self.score < 3:  # Show instructions for first 3 seconds
-            instructions = [
-                "Use LEFT/RIGHT arrows to move paddle",
-                "Keep the ball from entering the green semicircle!",
-                "Survive as long as possible!"
-            ]
-            for i, instruction in enumerate(instructions):
-                text = self.small_font.render(instruction, True, WHITE)
-                self.screen.blit(text, (10, SCREEN_HEIGHT - 80 + i * 25))
+        # Draw game objects
+        object_rects = [self.paddle.draw(screen), self.ball.draw(screen)]
+
+        # An object that moved a few pixels overlaps its old spot, so send
+        # one rect covering both instead of two
+        dirty_rects = []
+        for prev, rect in zip(self._prev_rects, object_rects):
+            if prev.colliderect(rect):
+                dirty_rects.append(prev.union(rect))
+            else:
+                dirty_rects.append(prev)
+                dirty_rects.append(rect)
+        
+        # Draw UI; text only needs presenting when its rendered surface changed
+        texts = {}
+        for slot, surface, pos in self._text_items():
+            rect = screen.blit(surface, pos)
+            texts[slot] = (surface, rect)
+            prev = self._prev_texts.get(slot)
+            if prev is None or prev[0] is not surface:
+                dirty_rects.append(rect)
+                if prev is not None:
+                    dirty_rects.append(prev[1])
+        for slot, (_, rect) in self._prev_texts.items():
+            if slot not in texts:
+                dirty_rects.append(rect)
+        
+        self._prev_rects = object_rects
+        self._prev_texts = texts
+        _update_rects(dirty_rects)
+    
+    def _draw_full(self):
+        """Repaint the whole screen and flip it"""
+        # Static playfield
+        self.screen.blit(self._background, (0, 0))
+        
+        # Draw game objects
+        object_rects = [self.paddle.draw(self.screen), self.ball.draw(self.screen)]
+        
+        # Draw UI
+        texts = {}
+        for slot, surface, pos in self._text_items():
+            texts[slot] = (surface, self.screen.blit(surface, pos))
         
         # Draw game over screen
         if self.game_over:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(128)
-            overlay.fill(BLACK)
-            self.screen.blit(overlay, (0, 0))
-            
-            game_over_text = self.font.render("GAME OVER", True, WHITE)
-            final_score_text = self.font.render(f"Final Time: {self.score}s", True, GREEN)
-            final_bounces_text = self.font.render(f"Total Bounces: {self.bounces}", True, GREEN)
-            final_lives_text = self.font.render(f"Lives Used: {3 - self.lives}/3", True, GREEN)
-            restart_text = self.small_font.render("Press R to restart or ESC to quit", True, WHITE)
-            
-            # Center the text
-            game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 80))
-            score_rect = final_score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 40))
-            bounces_rect = final_bounces_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
-            lives_rect = final_lives_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 40))
-            restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 80))
-            
-            self.screen.blit(game_over_text, game_over_rect)
-            self.screen.blit(final_score_text, score_rect)
-            self.screen.blit(final_bounces_text, bounces_rect)
-            self.screen.blit(final_lives_text, lives_rect)
-            self.screen.blit(restart_text, restart_rect)
-        
-        pygame.display.flip()
+            self.screen.blit(self._game_over_dim, (0, 0))
+            for text, rect in self._game_over_texts:
+                self.screen.blit(text, rect)
+        
+        _flip()
+        self._prev_rects = object_rects
+        self._prev_texts = texts
+        self._full_redraw = False
     
     def restart(self):
         """Restart the game"""
-        self.ball = Ball(CIRCLE_CENTER[0], CIRCLE_CENTER[1] - 50, self)  # Pass game reference
+        self.ball.reset(CIRCLE_CX, CIRCLE_CY - 50)
         self.paddle = Paddle()
         self.score = 0
         self.bounces = 0
         self.lives = 3
         self.life_lost = False
-        self.paddle_collision_cooldown = 0
+        self._reset_at_tick = None
         self.game_over = False
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = _get_ticks()
+        self._full_redraw = True  # Clear the game over screen
     
     def run(self):
         """Main game loop"""
         running = True
         
         while running:
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            # Handle events; the game over screen is static, so block until
+            # there is input instead of polling at full frame rate
+            if self.game_over:
+                events = [_event_wait()] + _event_get()
+            else:
+                events = _event_get()
+            
+            for event in events:
+                if event.type == QUIT:
                     running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
+                elif event.type == VIDEOEXPOSE:
+                    self._full_redraw = True  # Window contents need repainting
+                elif event.type == KEYDOWN:
+                    if event.key == K_ESCAPE:
                         running = False
-                    elif event.key == pygame.K_r and self.game_over:
+                    elif event.key == K_R and self.game_over:
                         self.restart()
             
             # Update and draw
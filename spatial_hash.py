@@ -0,0 +1,46 @@
+"""
+Spatial Hash Grid
+A uniform-grid broad phase that buckets circles by the cells their bounding
+box covers, so overlap queries only look at objects in nearby cells.
+"""
+
+import math
+
+
+class SpatialHashGrid:
+    """Grid of square cells mapping (col, row) to the ids of objects touching it"""
+    
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self._inv_cell_size = 1.0 / cell_size
+        self._cells = {}
+    
+    def clear(self):
+        """Remove every object from the grid"""
+        self._cells.clear()
+    
+    def _cell_range(self, x, y, r):
+        """Get the inclusive column and row range covered by a circle's bounding box"""
+        inv = self._inv_cell_size
+        return (math.floor((x - r) * inv), math.floor((x + r) * inv),
+                math.floor((y - r) * inv), math.floor((y + r) * inv))
+    
+    def insert(self, item_id, x, y, r):
+        """Add an object with a circular footprint to every cell it overlaps"""
+        col_min, col_max, row_min, row_max = self._cell_range(x, y, r)
+        cells = self._cells
+        for col in range(col_min, col_max + 1):
+            for row in range(row_min, row_max + 1):
+                cells.setdefault((col, row), []).append(item_id)
+    
+    def query_circle(self, x, y, r):
+        """Get the ids of objects sharing a cell with the given circle's bounding box"""
+        col_min, col_max, row_min, row_max = self._cell_range(x, y, r)
+        cells = self._cells
+        found = set()
+        for col in range(col_min, col_max + 1):
+            for row in range(row_min, row_max + 1):
+                bucket = cells.get((col, row))
+                if bucket:
+                    found.update(bucket)
+        return found